@@ -161,6 +161,8 @@ class App(ctk.CTk):
         container.grid_columnconfigure(0, weight=1)
 
         self._frames: AppFrameRegistry = {}
+        # Class-name index for get_frame_class, kept in step with _frames
+        self._frame_classes_by_name: dict[str, AppFrameClass] = {}
 
         for frame_cls in (
             CareerSelectFrame,
@@ -184,6 +186,7 @@ class App(ctk.CTk):
             try:
                 frame = frame_cls(container, self, self._theme)
                 self._frames[frame_cls] = frame
+                self._frame_classes_by_name[frame_cls.__name__] = frame_cls
                 frame.grid(row=0, column=0, sticky="nsew")
             except Exception as e:
                 logger.critical(
@@ -267,8 +270,8 @@ class App(ctk.CTk):
     def get_frame_class(self, name: str) -> AppFrameClass:
         """Resolve a frame class by its name from the registered frames.
 
-        Iterates over known frame types and returns the one whose class name
-        matches the requested identifier, enforcing a clear error if missing.
+        Looks the class name up in the index built while frames are registered,
+        enforcing a clear error if missing.
 
         Args:
             name (str): The class name of the frame to look up.
@@ -279,10 +282,9 @@ class App(ctk.CTk):
         Raises:
             FrameNotFoundError: If no frame with the given class name is found.
         """
-        for cls in self._frames:
-            if cls.__name__ == name:
-                return cls
-        raise FrameNotFoundError(f"No frame class named '{name}' found.")
+        if (cls := self._frame_classes_by_name.get(name)) is None:
+            raise FrameNotFoundError(f"No frame class named '{name}' found.")
+        return cls
 
     def show_frame(self, page_class: AppFrameClass) -> None:
         """Raise a target frame to the front and trigger its lifecycle hooks.
@@ -112,6 +112,8 @@ class DataManager:
         # In-memory data caches, initially empty
         self.players: list[Player] = []
         self.matches: list[Match] = []
+        # (path, mtime_ns, size) of players.json when the cache was last synced
+        self._players_file_stamp: tuple[Path, int, int] | None = None
 
     # --- Career Selection and Metadata Workflow ---
 
@@ -187,6 +189,7 @@ class DataManager:
         self.matches_path: Path = artifacts.matches_path
         self.players: list[Player] = []
         self.matches: list[Match] = []
+        self._players_file_stamp = None
 
     def get_all_career_names(self) -> list[str]:
         """Retrieve and format all career display names from the central registry.
@@ -316,6 +319,7 @@ class DataManager:
         self.matches: list[Match] = self._json_service.load_json(
             self.matches_path, Match
         )
+        self._players_file_stamp = None
 
         logger.info(
             "Career '%s' loaded successfully. Players: %s, Matches: %s",
@@ -476,6 +480,32 @@ class DataManager:
             self.players_path, Player
         )
 
+    def refresh_players_if_changed(self) -> None:
+        """Refresh the players cache only when players.json changed on disk.
+
+        Compares the file's path, modification time, and size against the
+        values recorded at the last sync and skips the reload when they match.
+        Used by read-heavy flows such as dropdown population that would
+        otherwise re-parse the whole player file on every screen visit.
+        """
+        if not self.players_path:
+            logger.warning("Attempted to refresh players before loading a career.")
+            return
+
+        try:
+            stat = self.players_path.stat()
+        except OSError:
+            self._players_file_stamp = None
+            self.refresh_players()
+            return
+
+        stamp = (self.players_path, stat.st_mtime_ns, stat.st_size)
+        if stamp == self._players_file_stamp:
+            return
+
+        self.refresh_players()
+        self._players_file_stamp = stamp
+
     def refresh_matches(self) -> None:
         """Read matches.json from disk to synchronize the internal instance cache.
 
@@ -954,6 +984,11 @@ class DataManager:
         to proceed. Delegates the raw disk I/O and parsing to
         `JsonService.load_list_strict_or_raise`.
 
+        Every player mutation starts here, so the recorded players.json stamp is
+        cleared first; if the following save fails, the next
+        `refresh_players_if_changed` call still reloads instead of keeping the
+        unsaved in-memory edit.
+
         Returns:
             list[Player]: A fully validated list of Pydantic Player models.
 
@@ -966,6 +1001,7 @@ class DataManager:
                 "Cannot load players: no active career/players path is set."
             )
 
+        self._players_file_stamp = None
         return self._json_service.load_list_strict_or_raise(players_path, Player)
 
     def _load_matches_strict_or_raise(self) -> list[Match]:
@@ -329,7 +329,7 @@ class PlayerService:
                 surname key.
         """
         # Ensure memory is synced with disk before building the list
-        self._data_manager.refresh_players()
+        self._data_manager.refresh_players_if_changed()
 
         if not self._data_manager.players:
             return []
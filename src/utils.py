@@ -1,6 +1,8 @@
 """Shared utility helpers for screen coordinates and value normalization."""
 
+import functools
 import logging
+import re
 import string
 from datetime import datetime
 from typing import TypeGuard
@@ -18,6 +20,7 @@ from src.contracts.coordinates import (
 logger = logging.getLogger(__name__)
 
 COMPETITION_ACRONYMS = frozenset(["UEFA", "FIFA", "MLS", "EFL", "FA", "DFB", "DFL"])
+IN_GAME_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})", re.ASCII)
 
 
 # --------------- Screen-resolution helpers ---------------
@@ -130,6 +133,34 @@ def safe_int_conversion(value: str | int | float | None) -> int | None:
     return None
 
 
+@functools.lru_cache(maxsize=64)
+def parse_in_game_date(date_str: str) -> datetime | None:
+    """Parse a dd/mm/yy or dd/mm/yyyy in-game date without strptime.
+
+    Two-digit years follow the strptime `%y` pivot (69-99 -> 1900s,
+    00-68 -> 2000s). Results are memoized because the same date is usually
+    re-validated across retries and screens, and `datetime` is immutable.
+
+    Args:
+        date_str (str): The user-provided date string.
+
+    Returns:
+        datetime | None: The parsed date, or None when the string is not a
+        valid calendar date in either format.
+    """
+    match = IN_GAME_DATE_PATTERN.fullmatch(date_str.strip())
+    if match is None:
+        return None
+    day, month, year_text = match.groups()
+    year = int(year_text)
+    if len(year_text) == 2:
+        year += 1900 if year >= 69 else 2000
+    try:
+        return datetime(year, int(month), int(day))
+    except ValueError:
+        return None
+
+
 def derive_season(date_str: str) -> str:
     """Derive the football season string from a dd/mm/yy date.
 
@@ -11,6 +11,7 @@ import logging
 
 import customtkinter as ctk
 
+from src.contracts.backend import PlayerAttributePayload
 from src.contracts.ui import AddGKFrameControllerProtocol, BaseViewThemeProtocol
 from src.utils import safe_int_conversion
 from src.views.base_view_frame import BaseViewFrame
@@ -19,6 +20,30 @@ from src.views.widgets.scrollable_dropdown import ScrollableDropdown
 
 logger = logging.getLogger(__name__)
 
+# Goalkeeper attribute keys and their display labels, in on-screen order
+GK_ATTR_DEFINITIONS: tuple[tuple[str, str], ...] = (
+    ("diving", "Diving"),
+    ("handling", "Handling"),
+    ("kicking", "Kicking"),
+    ("reflexes", "Reflexes"),
+    ("positioning", "Positioning"),
+)
+# Display labels for every payload key, used in missing-field warnings
+GK_KEY_TO_LABEL: dict[str, str] = dict(GK_ATTR_DEFINITIONS) | {
+    "name": "Name",
+    "country": "Country",
+    "in_game_date": "In-game Date",
+    "height": "Height",
+    "age": "Age",
+    "weight": "Weight",
+}
+# Existing players reuse stored bio values, so only these keys are required
+GK_EXISTING_PLAYER_REQUIRED_KEYS: tuple[str, ...] = (
+    *(key for key, _ in GK_ATTR_DEFINITIONS),
+    "name",
+    "in_game_date",
+)
+
 
 class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMixin):
     """Data-entry frame for goalkeeper bio and attribute updates.
@@ -59,13 +84,6 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         logger.info("Initializing AddGKFrame")
 
         self.attr_vars: dict[str, ctk.StringVar] = {}
-        self.attr_definitions: list[tuple[str, str]] = [
-            ("diving", "Diving"),
-            ("handling", "Handling"),
-            ("kicking", "Kicking"),
-            ("reflexes", "Reflexes"),
-            ("positioning", "Positioning"),
-        ]
 
         self._setup_ui()
 
@@ -75,27 +93,24 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         Builds name selection, in-game date, bio, and attribute input controls
         so users can create or update goalkeeper profiles in a structured form.
         """
-        self.grid_columnconfigure(0, weight=1)
+        body_font: ctk.CTkFont = self.fonts["body"]
+
+        self.grid_columnconfigure((0, 2), weight=1)
         self.grid_columnconfigure(1, weight=2)
-        self.grid_columnconfigure(2, weight=1)
-        for i in range(6):
-            self.grid_rowconfigure(i, weight=1 if i in [0, 5] else 0)
+        self.grid_rowconfigure((0, 5), weight=1)
+        self.grid_rowconfigure((1, 2, 3, 4), weight=0)
 
         self.name_and_date_frame = ctk.CTkFrame(self)
         self.name_and_date_frame.grid(row=1, column=1, pady=(10, 5), sticky="ew")
-        self.name_and_date_frame.grid_columnconfigure(0, weight=1)
-        self.name_and_date_frame.grid_columnconfigure(1, weight=0)
-        self.name_and_date_frame.grid_columnconfigure(2, weight=0)
-        self.name_and_date_frame.grid_columnconfigure(3, weight=1)
-        self.name_and_date_frame.grid_rowconfigure(0, weight=1)
-        self.name_and_date_frame.grid_rowconfigure(1, weight=0)
-        self.name_and_date_frame.grid_rowconfigure(2, weight=0)
-        self.name_and_date_frame.grid_rowconfigure(3, weight=1)
+        self.name_and_date_frame.grid_columnconfigure((0, 3), weight=1)
+        self.name_and_date_frame.grid_columnconfigure((1, 2), weight=0)
+        self.name_and_date_frame.grid_rowconfigure((0, 3), weight=1)
+        self.name_and_date_frame.grid_rowconfigure((1, 2), weight=0)
 
         self.name_entry = ctk.CTkEntry(
             self.name_and_date_frame,
             placeholder_text="Enter name here",
-            font=self.fonts["body"],
+            font=body_font,
             width=200,
         )
         self.name_entry.grid(row=1, column=1, pady=(10, 5), padx=(0, 10), sticky="e")
@@ -116,7 +131,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         )
 
         self.in_game_date_label = ctk.CTkLabel(
-            self.name_and_date_frame, text="In-game date:", font=self.fonts["body"]
+            self.name_and_date_frame, text="In-game date:", font=body_font
         )
         self.in_game_date_label.grid(
             row=2, column=1, padx=(20, 10), pady=(10, 5), sticky="w"
@@ -124,7 +139,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         self.in_game_date_entry = ctk.CTkEntry(
             self.name_and_date_frame,
             placeholder_text="dd/mm/yy",
-            font=self.fonts["body"],
+            font=body_font,
         )
         self.in_game_date_entry.grid(
             row=2, column=2, pady=(10, 5), padx=(10, 20), sticky="ew"
@@ -132,57 +147,33 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
 
         self.base_attr_row = ctk.CTkFrame(self)
         self.base_attr_row.grid(row=2, column=1, pady=(5, 10), sticky="nsew")
-        self.base_attr_row.grid_columnconfigure(0, weight=1)
-        self.base_attr_row.grid_columnconfigure(1, weight=0)
-        self.base_attr_row.grid_columnconfigure(2, weight=0)
-        self.base_attr_row.grid_columnconfigure(3, weight=0)
-        self.base_attr_row.grid_columnconfigure(4, weight=0)
-        self.base_attr_row.grid_columnconfigure(5, weight=1)
+        self.base_attr_row.grid_columnconfigure((0, 5), weight=1)
+        self.base_attr_row.grid_columnconfigure((1, 2, 3, 4), weight=0)
         self.base_attr_row.grid_rowconfigure(0, weight=1)
 
-        self.age_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Age",
-            font=self.fonts["body"],
-            width=160,
+        self.age_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Age", row=0, column=1
         )
-        self.age_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-
-        self.height_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Height (ft'in\")",
-            font=self.fonts["body"],
-            width=160,
+        self.height_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Height (ft'in\")", row=0, column=2
         )
-        self.height_entry.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
-
-        self.weight_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Weight (lbs)",
-            font=self.fonts["body"],
-            width=160,
+        self.weight_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Weight (lbs)", row=0, column=3
         )
-        self.weight_entry.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
-
-        self.country_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Country",
-            font=self.fonts["body"],
-            width=160,
+        self.country_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Country", row=0, column=4
         )
-        self.country_entry.grid(row=0, column=4, padx=5, pady=5, sticky="ew")
 
         self.attributes_grid = ctk.CTkFrame(self)
         self.attributes_grid.grid(row=3, column=1, pady=(0, 10), sticky="nsew")
 
-        self.attributes_grid.grid_columnconfigure(0, weight=1)
-        self.attributes_grid.grid_columnconfigure(1, weight=0)
-        self.attributes_grid.grid_columnconfigure(2, weight=0)
-        self.attributes_grid.grid_columnconfigure(3, weight=1)
-        for i in range(len(self.attr_definitions)):
-            self.attributes_grid.grid_rowconfigure(i, weight=1)
+        self.attributes_grid.grid_columnconfigure((0, 3), weight=1)
+        self.attributes_grid.grid_columnconfigure((1, 2), weight=0)
+        self.attributes_grid.grid_rowconfigure(
+            tuple(range(len(GK_ATTR_DEFINITIONS))), weight=1
+        )
 
-        for i, (key, label) in enumerate(self.attr_definitions):
+        for i, (key, label) in enumerate(GK_ATTR_DEFINITIONS):
             self.create_data_row(
                 parent_widget=self.attributes_grid,
                 index=i,
@@ -195,11 +186,21 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
             self,
             text="Done",
             font=self.fonts["button"],
-            command=lambda: self._on_done_button_press(),
+            command=self._on_done_button_press,
         )
         self.done_button.grid(row=4, column=1, pady=(0, 20), sticky="ew")
         self.style_submit_button(self.done_button)
 
+        # Text entries cleared on every visit
+        self._resettable_entries: tuple[ctk.CTkEntry, ...] = (
+            self.name_entry,
+            self.in_game_date_entry,
+            self.age_entry,
+            self.height_entry,
+            self.weight_entry,
+            self.country_entry,
+        )
+
         self.apply_focus_flourishes(self)
 
     def on_show(self) -> None:
@@ -216,23 +217,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         self.refresh_player_dropdown(only_gk=True)
         self.player_dropdown.set_value("Or select existing player")
 
-        self.name_entry.delete(0, "end")
-        self.name_entry.configure(placeholder_text="Enter name here")
-
-        self.in_game_date_entry.delete(0, "end")
-        self.in_game_date_entry.configure(placeholder_text="dd/mm/yy")
-
-        self.age_entry.delete(0, "end")
-        self.age_entry.configure(placeholder_text="Age")
-
-        self.height_entry.delete(0, "end")
-        self.height_entry.configure(placeholder_text="Height (ft'in\")")
-
-        self.weight_entry.delete(0, "end")
-        self.weight_entry.configure(placeholder_text="Weight (lbs)")
-
-        self.country_entry.delete(0, "end")
-        self.country_entry.configure(placeholder_text="Country")
+        self.clear_entries(self._resettable_entries)
 
     def _on_player_selected(self, name: str) -> None:
         """Populate bio fields from the selected existing player record.
@@ -271,16 +256,30 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         to the player library on success. Any failed validation step short-
         circuits the flow immediately.
         """
+        # Resolve the name first so an empty form fails before any other reads
+        player_name_dropdown: str | None = self.resolve_selected_player_name(
+            self.player_dropdown_var.get()
+        )
+        player_name: str | None = (
+            player_name_dropdown or self.name_entry.get().strip() or None
+        )
+        if player_name is None:
+            self.show_error(
+                "Validation Error", "Please enter a name or select an existing player."
+            )
+            return
+
         # Convert attributes to integers using helper
-        ui_data: dict[str, str | int | None] = {
+        ui_data: PlayerAttributePayload = {
             key: safe_int_conversion(var.get()) for key, var in self.attr_vars.items()
         }
 
-        if not self.validate_attr_range(ui_data, self.attr_definitions):
+        if not self.validate_attr_range(ui_data, GK_ATTR_DEFINITIONS):
             return
+        ui_data["name"] = player_name
 
         # Handle Text fields
-        # usage of "or None" ensures empty strings become None for consistent validation
+        # Placeholder text and empty strings are normalized to None
         invalid_fields: list[str] = [
             "Enter name here",
             "dd/mm/yy",
@@ -290,21 +289,9 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
             "Age",
             "",
         ]
-        player_name_dropdown: str | None = self.resolve_selected_player_name(
-            self.player_dropdown_var.get()
-        )
-        ui_data["name"] = player_name_dropdown or self.name_entry.get().strip() or None
-
-        if ui_data["name"] is None:
-            self.show_error(
-                "Validation Error", "Please enter a name or select an existing player."
-            )
-            return
-
         is_existing_player = player_name_dropdown is not None
 
-        country: str = self.country_entry.get().strip()
-        ui_data["country"] = country if country not in invalid_fields else None
+        ui_data["country"] = self.read_optional_text(self.country_entry, invalid_fields)
 
         in_game_date: str = self.in_game_date_entry.get().strip()
         if not self.validate_in_game_date(in_game_date):
@@ -313,23 +300,16 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
 
         ui_data["height"] = self._get_height(invalid_fields)
 
-        # Handle Numeric bio fields (Age/Weight) - Convert to int standardizes them
-        age_raw: int | None = safe_int_conversion(self.age_entry.get())
-        if age_raw is None:
-            ui_data["age"] = None
-
-        elif not self.validate_age(age_raw):
+        # Empty input stays None; the validators allow it and the required check decides
+        age: int | None = safe_int_conversion(self.age_entry.get())
+        if not self.validate_age(age):
             return
-        else:
-            ui_data["age"] = age_raw
-        weight_raw: int | None = safe_int_conversion(self.weight_entry.get())
-        if weight_raw is None:
-            ui_data["weight"] = None
+        ui_data["age"] = age
 
-        elif not self.validate_weight(weight_raw):
+        weight: int | None = safe_int_conversion(self.weight_entry.get())
+        if not self.validate_weight(weight):
             return
-        else:
-            ui_data["weight"] = weight_raw
+        ui_data["weight"] = weight
 
         if not self._validate_required_fields(ui_data, is_existing_player):
             return
@@ -351,14 +331,13 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         Returns:
             str | None: Normalized height string when valid, otherwise None.
         """
-        height_raw: str = self.height_entry.get().strip()
-        if height_raw and height_raw not in invalid_fields:
-            height: str | None = self.validate_height(height_raw)
-            return None if height is None else height
-        return None
+        height_raw: str | None = self.read_optional_text(
+            self.height_entry, invalid_fields
+        )
+        return None if height_raw is None else self.validate_height(height_raw)
 
     def _validate_required_fields(
-        self, ui_data: dict[str, str | int | None], is_existing_player: bool
+        self, ui_data: PlayerAttributePayload, is_existing_player: bool
     ) -> bool:
         """Check whether all required fields are present for the save scenario.
 
@@ -369,7 +348,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         base-frame helper.
 
         Args:
-            ui_data (dict[str, str | int | None]): Candidate payload assembled
+            ui_data (PlayerAttributePayload): Candidate payload assembled
                 from current form values.
             is_existing_player (bool): True when a player was chosen from the
                 dropdown; False for a newly entered player.
@@ -377,26 +356,15 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         Returns:
             bool: True when required fields are present; False otherwise.
         """
-        key_to_label: dict[str, str] = dict(self.attr_definitions) | {
-            "name": "Name",
-            "country": "Country",
-            "in_game_date": "In-game Date",
-            "height": "Height",
-            "age": "Age",
-            "weight": "Weight",
-        }
-        if is_existing_player:
-            required_keys: list[str] = [k for k, _ in self.attr_definitions] + [
-                "name",
-                "in_game_date",
-            ]
-        else:
-            required_keys: list[str] | None = None
         return self.check_missing_fields(
-            ui_data, key_to_label, required_keys=required_keys
+            ui_data,
+            GK_KEY_TO_LABEL,
+            required_keys=(
+                GK_EXISTING_PLAYER_REQUIRED_KEYS if is_existing_player else None
+            ),
         )
 
-    def _buffer_and_return(self, ui_data: dict[str, str | int | None]) -> bool:
+    def _buffer_and_return(self, ui_data: PlayerAttributePayload) -> bool:
         # sourcery skip: extract-method
         """Buffer goalkeeper data, persist it, and return to the library view.
 
@@ -406,7 +374,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
         context and presents an actionable error dialog.
 
         Args:
-            ui_data (dict[str, str | int | None]): Fully validated goalkeeper
+            ui_data (PlayerAttributePayload): Fully validated goalkeeper
                 payload composed from form inputs.
 
         Returns:
@@ -421,7 +389,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
             self.controller.save_player()
 
             logger.info(
-                f"Successfully saved GK {ui_data['name']}. Navigating to Library."
+                "Successfully saved GK %s. Navigating to Library.", ui_data["name"]
             )
             self.show_success(
                 "Goalkeeper Saved", f"Goalkeeper {ui_data['name']} saved successfully!"
@@ -432,7 +400,7 @@ class AddGKFrame(BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMix
             return True
         except Exception as e:
             # Safely catch Pydantic rejections from the Controller
-            logger.error(f"Failed to save Goalkeeper data: {e}", exc_info=True)
+            logger.error("Failed to save Goalkeeper data: %s", e, exc_info=True)
             self.show_error(
                 "Error Saving Data", f"An error occurred: \n{e!s}\n\nPlease try again."
             )
@@ -7,9 +7,11 @@ delegating persistence and navigation to the controller.
 """
 
 import logging
+from typing import cast
 
 import customtkinter as ctk
 
+from src.contracts.backend import InjuryDataPayload
 from src.contracts.ui import (
     AddInjuryFrameControllerProtocol,
     BaseViewThemeProtocol,
@@ -21,6 +23,17 @@ from src.views.widgets.scrollable_dropdown import ScrollableDropdown
 
 logger = logging.getLogger(__name__)
 
+# Injury input keys and their display labels, in on-screen order
+INJURY_STAT_DEFINITIONS: tuple[tuple[str, str], ...] = (
+    ("in_game_date", "In-game Date"),
+    ("injury_detail", "Injury Detail"),
+    ("time_out", "Time Out"),
+)
+INJURY_KEY_TO_LABEL: dict[str, str] = dict(INJURY_STAT_DEFINITIONS)
+# Every injury field is required and may not be left as zero
+INJURY_REQUIRED_KEYS: tuple[str, ...] = tuple(INJURY_KEY_TO_LABEL)
+TIME_OUT_UNITS: tuple[str, ...] = ("Days", "Weeks", "Months")
+
 
 class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
     """Data-entry frame for logging a player's injury record.
@@ -57,12 +70,6 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
 
         logger.info("Initializing AddInjuryFrame")
 
-        self.stat_definitions: list[tuple[str, str]] = [
-            ("in_game_date", "In-game Date"),
-            ("injury_detail", "Injury Detail"),
-            ("time_out", "Time Out"),
-        ]
-
         self.time_out_unit_var = ctk.StringVar(value="Select unit")
 
         self._setup_ui()
@@ -73,11 +80,10 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
         Builds the heading, player selector, injury detail rows, and submit
         button so users can record injury events for existing players.
         """
-        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure((0, 2), weight=1)
         self.grid_columnconfigure(1, weight=2)
-        self.grid_columnconfigure(2, weight=1)
-        for i in range(5):
-            self.grid_rowconfigure(i, weight=1 if i in [0, 4] else 0)
+        self.grid_rowconfigure((0, 4), weight=1)
+        self.grid_rowconfigure((1, 2, 3), weight=0)
 
         # Main heading
         self.main_heading = ctk.CTkLabel(
@@ -102,16 +108,13 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
         self.data_frame = ctk.CTkFrame(self)
         self.data_frame.grid(row=3, column=1, pady=(0, 20))
 
-        self.data_frame.grid_columnconfigure(0, weight=1)
-        self.data_frame.grid_columnconfigure(1, weight=0)
-        self.data_frame.grid_columnconfigure(2, weight=0)
-        self.data_frame.grid_columnconfigure(3, weight=0)
-        self.data_frame.grid_columnconfigure(4, weight=1)
-
-        for i in range(len(self.stat_definitions)):
-            self.data_frame.grid_rowconfigure(i, weight=1)
+        self.data_frame.grid_columnconfigure((0, 4), weight=1)
+        self.data_frame.grid_columnconfigure((1, 2, 3), weight=0)
+        self.data_frame.grid_rowconfigure(
+            tuple(range(len(INJURY_STAT_DEFINITIONS))), weight=1
+        )
 
-        for i, (key, name) in enumerate(self.stat_definitions):
+        for i, (key, name) in enumerate(INJURY_STAT_DEFINITIONS):
             self._create_entry_row(i, key, name)
 
         # Done Button
@@ -133,14 +136,9 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
         the time-out unit selection, refreshes available player options, and
         returns focus to a non-entry widget so placeholders remain visible.
         """
-        for key, entry in self.data_vars.items():
-            entry.delete(0, "end")
-            entry.configure(
-                placeholder_text="dd/mm/yy" if key == "in_game_date" else ""
-            )
+        self.clear_entries(self.data_vars.values())
 
-        self.time_out_unit_var.set("Select unit")
-        self.time_out_unit_dropdown.set_value("Select Unit")
+        self.time_out_unit_dropdown.set_value("Select unit")
 
         self.refresh_player_dropdown(remove_on_loan=True)
         self.player_dropdown.set_value("Click here to select player")
@@ -161,9 +159,8 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
             data_key (str): Internal payload key associated with the row.
             data_name (str): User-facing label text for the row.
         """
-        data_label = ctk.CTkLabel(
-            self.data_frame, text=data_name, font=self.fonts["body"]
-        )
+        body_font: ctk.CTkFont = self.fonts["body"]
+        data_label = ctk.CTkLabel(self.data_frame, text=data_name, font=body_font)
         data_label.grid(row=index, column=1, padx=5, pady=5, sticky="w")
 
         placeholder_text = "dd/mm/yy" if data_key == "in_game_date" else ""
@@ -172,7 +169,7 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
 
         data_entry = ctk.CTkEntry(
             self.data_frame,
-            font=self.fonts["body"],
+            font=body_font,
             placeholder_text=placeholder_text,
             width=entry_width,
         )
@@ -192,7 +189,7 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
                 theme=self.theme,
                 fonts=self.fonts,
                 variable=self.time_out_unit_var,
-                values=["Days", "Weeks", "Months"],
+                values=list(TIME_OUT_UNITS),
                 width=145,
                 dropdown_height=150,
                 placeholder="Select unit",
@@ -219,32 +216,31 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
             )
             return
 
-        ui_data = {key: entry.get() for key, entry in self.data_vars.items()}
-        key_to_label = dict(self.stat_definitions)
-        required_injury_keys = [key for key, _ in self.stat_definitions]
+        # Read each entry once; the payload is assembled only after validation
+        in_game_date = self.data_vars["in_game_date"].get().strip()
+        injury_detail = self.data_vars["injury_detail"].get().strip()
+        time_out_text = self.data_vars["time_out"].get().strip()
         if not self.check_missing_fields(
-            ui_data,
-            key_to_label=key_to_label,
-            required_keys=required_injury_keys,
-            zero_invalid_keys=required_injury_keys,
+            {
+                "in_game_date": in_game_date,
+                "injury_detail": injury_detail,
+                "time_out": time_out_text,
+            },
+            key_to_label=INJURY_KEY_TO_LABEL,
+            required_keys=INJURY_REQUIRED_KEYS,
+            zero_invalid_keys=INJURY_REQUIRED_KEYS,
         ):
             return
 
         time_out_unit = self.time_out_unit_var.get()
-        if time_out_unit in ["Select unit", ""]:
+        if time_out_unit not in TIME_OUT_UNITS:
             self.show_warning("Selection Error", "Please select a unit for 'Time Out'.")
             return
-        ui_data["time_out_unit"] = time_out_unit
 
-        # Convert time_out to an integer if possible, otherwise show a warning
-        try:
-            ui_data["time_out"] = safe_int_conversion(ui_data["time_out"])
-        except ValueError:
+        time_out = safe_int_conversion(time_out_text)
+        if time_out is None:
             logger.warning(
-                (
-                    f"Invalid input for 'Time Out': {ui_data['time_out']}. ",
-                    "Must be a number.",
-                )
+                "Invalid input for 'Time Out': %s. Must be a number.", time_out_text
             )
             self.show_warning(
                 "Input Error",
@@ -256,13 +252,24 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
             return
 
         # Preemptive Date Validation
-        in_game_date_str = str(ui_data.get("in_game_date", "")).strip()
-        if not self.validate_in_game_date(in_game_date_str):
+        if not self.validate_in_game_date(in_game_date):
             return
 
+        injury_data = cast(
+            InjuryDataPayload,
+            {
+                "in_game_date": in_game_date,
+                "injury_detail": injury_detail,
+                "time_out": time_out,
+                "time_out_unit": time_out_unit,
+            },
+        )
+
+        # Block repeat clicks from queueing a second save while this one runs
+        self.done_button.configure(state="disabled")
         try:
             logger.info(f"Validation passed. Saving injury record for {player_name}.")
-            self.controller.add_injury_record(player_name, ui_data)
+            self.controller.add_injury_record(player_name, injury_data)
             self.show_success(
                 "Data Saved",
                 f"Injury record for {player_name} has been successfully saved.",
@@ -276,4 +283,5 @@ class AddInjuryFrame(BaseViewFrame, PlayerDropdownMixin, EntryFocusMixin):
             self.show_error(
                 "Error Saving Data", f"An error occurred: {e!s}\n\nPlease try again."
             )
-            return
+        finally:
+            self.done_button.configure(state="normal")
@@ -17,6 +17,9 @@ from src.views.widgets.scrollable_dropdown import ScrollableDropdown
 
 logger = logging.getLogger(__name__)
 
+# Dropdown values that mean no competition has been chosen yet
+COMPETITION_PLACEHOLDERS: frozenset[str] = frozenset({"Select Competition", ""})
+
 
 class AddMatchFrame(BaseViewFrame):
     """Data-entry frame for pre-capture match setup.
@@ -92,24 +95,7 @@ class AddMatchFrame(BaseViewFrame):
 
         # Competition dropdown
         self.competition_var = ctk.StringVar(value="Select Competition")
-        comps = []
-        # Try to prefetch from current career metadata
-        try:
-            if getattr(self.controller, "get_current_career_details", None):
-                meta = self.controller.get_current_career_details()
-                if meta and getattr(meta, "competitions", None):
-                    comps = meta.competitions
-        except Exception as e:
-            logger.debug(
-                "Competition prefetch failed during AddMatchFrame init: %s",
-                e,
-                exc_info=True,
-            )
-            comps = []
-        logger.debug(
-            "Loaded %s competition option(s) during AddMatchFrame init.",
-            len(comps),
-        )
+        comps: list[str] = self._fetch_competitions()
 
         self.competition_dropdown = ScrollableDropdown(
             self.form_frame,
@@ -145,7 +131,7 @@ class AddMatchFrame(BaseViewFrame):
             self,
             text="Done",
             font=self.fonts["button"],
-            command=lambda: self._on_done_button_press(),
+            command=self._on_done_button_press,
         )
         self.done_button.pack(pady=10)
         self.style_submit_button(self.done_button)
@@ -158,23 +144,7 @@ class AddMatchFrame(BaseViewFrame):
         pre-capture inputs synchronized with latest career metadata each time
         the frame is displayed.
         """
-        # Attempt to load competitions from current career metadata
-        comps: list[str] = []
-        try:
-            meta: CareerMetadata | None = self.controller.get_current_career_details()
-            if meta and getattr(meta, "competitions", None):
-                comps: list[str] = meta.competitions
-        except Exception as e:
-            logger.debug(
-                "Failed to refresh competition list in AddMatchFrame.on_show: %s",
-                e,
-                exc_info=True,
-            )
-            comps: list[str] = []
-        logger.debug(
-            "Loaded %s competition option(s) in AddMatchFrame.on_show.",
-            len(comps),
-        )
+        comps: list[str] = self._fetch_competitions()
 
         # Update dropdown options
         try:
@@ -198,6 +168,29 @@ class AddMatchFrame(BaseViewFrame):
         self.in_game_date_entry.delete(0, "end")
         self.in_game_date_entry.configure(placeholder_text="dd/mm/yy")
 
+    def _fetch_competitions(self) -> list[str]:
+        """Return the competitions configured for the active career.
+
+        Shared by initial construction and `on_show` so both paths read the
+        career metadata the same way. Lookup failures are logged and treated
+        as an empty list, which the callers surface as "No competitions
+        available".
+
+        Returns:
+            list[str]: Competition names, or an empty list when no career is
+            loaded or the metadata cannot be read.
+        """
+        try:
+            meta: CareerMetadata | None = self.controller.get_current_career_details()
+        except Exception as e:
+            logger.debug(
+                "Failed to load competitions for AddMatchFrame: %s", e, exc_info=True
+            )
+            return []
+        comps: list[str] = getattr(meta, "competitions", None) or []
+        logger.debug("Loaded %s competition option(s) for AddMatchFrame.", len(comps))
+        return comps
+
     def _on_done_button_press(self) -> None:
         """Validate setup inputs, stage match overview, and start capture.
 
@@ -256,8 +249,7 @@ class AddMatchFrame(BaseViewFrame):
 
         # Validate competition selection
         competition: str = self.competition_var.get()
-        invalid_states: list[str | None] = ["Select Competition", "", None]
-        if competition in invalid_states:
+        if competition in COMPETITION_PLACEHOLDERS:
             logger.warning(
                 "AddMatchFrame blocked: no competition selected. value='%s'",
                 competition,
@@ -288,7 +280,9 @@ class AddMatchFrame(BaseViewFrame):
             self.show_error("Error", f"Failed to save match overview: {e}")
             return
 
-        # Start capture and navigate to MatchStatsFrame
+        # Start capture and navigate to MatchStatsFrame. The screenshot delay
+        # runs a nested event loop, so block repeat clicks until it finishes
+        self.done_button.configure(state="disabled")
         try:
             logger.info("Initiating match stats capture process.")
             self.controller.process_match_stats()
@@ -308,3 +302,5 @@ class AddMatchFrame(BaseViewFrame):
                     f"match stats:\n{e!s}\n\nPlease try again."
                 ),
             )
+        finally:
+            self.done_button.configure(state="normal")
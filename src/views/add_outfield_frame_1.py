@@ -10,6 +10,7 @@ import logging
 
 import customtkinter as ctk
 
+from src.contracts.backend import PlayerAttributePayload
 from src.contracts.ui import (
     AddOutfieldFrame1ControllerProtocol,
     BaseViewThemeProtocol,
@@ -21,6 +22,43 @@ from src.views.widgets.scrollable_dropdown import ScrollableDropdown
 
 logger = logging.getLogger(__name__)
 
+# Page-one outfield attribute keys and display labels, in on-screen order
+OUTFIELD_PHYSICAL_ATTR_DEFINITIONS: tuple[tuple[str, str], ...] = (
+    ("acceleration", "Acceleration"),
+    ("agility", "Agility"),
+    ("balance", "Balance"),
+    ("jumping", "Jumping"),
+    ("sprint_speed", "Sprint Speed"),
+    ("stamina", "Stamina"),
+    ("strength", "Strength"),
+)
+OUTFIELD_MENTAL_ATTR_DEFINITIONS: tuple[tuple[str, str], ...] = (
+    ("aggression", "Aggression"),
+    ("att_position", "Att. Position"),
+    ("composure", "Composure"),
+    ("interceptions", "Interceptions"),
+    ("reactions", "Reactions"),
+    ("vision", "Vision"),
+)
+OUTFIELD_PAGE1_ATTR_DEFINITIONS: tuple[tuple[str, str], ...] = (
+    *OUTFIELD_PHYSICAL_ATTR_DEFINITIONS,
+    *OUTFIELD_MENTAL_ATTR_DEFINITIONS,
+)
+OUTFIELD_PAGE1_KEY_TO_LABEL: dict[str, str] = {
+    "name": "Name",
+    "in_game_date": "In-game Date",
+    "position": "Position",
+    "height": "Height",
+    "country": "Country",
+    "age": "Age",
+    "weight": "Weight",
+} | dict(OUTFIELD_PAGE1_ATTR_DEFINITIONS)
+OUTFIELD_EXISTING_PLAYER_REQUIRED_KEYS: tuple[str, ...] = (
+    *(key for key, _ in OUTFIELD_PAGE1_ATTR_DEFINITIONS),
+    "name",
+    "in_game_date",
+)
+
 
 class AddOutfieldFrame1(
     BaseViewFrame, OCRDataMixin, PlayerDropdownMixin, EntryFocusMixin
@@ -39,9 +77,8 @@ class AddOutfieldFrame1(
         a player selection dropdown. The layout is designed for clarity and ease of
         use, with responsive resizing and clear labeling.
 
-        Internal dictionaries define the expected attributes and their labels,
-        which are used to dynamically generate the input fields and
-        validate the data on submission.
+        The module-level attribute definitions drive both the generated input
+        rows and the validation performed on submission.
 
         Args:
             parent (ctk.CTkFrame): The parent widget for this frame.
@@ -56,23 +93,6 @@ class AddOutfieldFrame1(
         logger.info("Initializing AddOutfieldFrame1")
 
         self.attr_vars: dict[str, ctk.StringVar] = {}
-        self.attr_definitions_physical: list[tuple[str, str]] = [
-            ("acceleration", "Acceleration"),
-            ("agility", "Agility"),
-            ("balance", "Balance"),
-            ("jumping", "Jumping"),
-            ("sprint_speed", "Sprint Speed"),
-            ("stamina", "Stamina"),
-            ("strength", "Strength"),
-        ]
-        self.attr_definitions_mental: list[tuple[str, str]] = [
-            ("aggression", "Aggression"),
-            ("att_position", "Att. Position"),
-            ("composure", "Composure"),
-            ("interceptions", "Interceptions"),
-            ("reactions", "Reactions"),
-            ("vision", "Vision"),
-        ]
 
         self._setup_ui()
 
@@ -83,27 +103,24 @@ class AddOutfieldFrame1(
         inputs so users can capture the initial half of an outfield player's
         profile before proceeding to technical attributes on page two.
         """
-        self.grid_columnconfigure(0, weight=1)
+        body_font: ctk.CTkFont = self.fonts["body"]
+
+        self.grid_columnconfigure((0, 2), weight=1)
         self.grid_columnconfigure(1, weight=2)
-        self.grid_columnconfigure(2, weight=1)
-        for i in range(7):
-            self.grid_rowconfigure(i, weight=1 if i in [0, 6] else 0)
+        self.grid_rowconfigure((0, 6), weight=1)
+        self.grid_rowconfigure((1, 2, 3, 4, 5), weight=0)
 
         self.name_and_date_frame = ctk.CTkFrame(self)
         self.name_and_date_frame.grid(row=1, column=1, pady=(10, 5), sticky="ew")
-        self.name_and_date_frame.grid_columnconfigure(0, weight=1)
-        self.name_and_date_frame.grid_columnconfigure(1, weight=0)
-        self.name_and_date_frame.grid_columnconfigure(2, weight=0)
-        self.name_and_date_frame.grid_columnconfigure(3, weight=1)
-        self.name_and_date_frame.grid_rowconfigure(0, weight=1)
-        self.name_and_date_frame.grid_rowconfigure(1, weight=0)
-        self.name_and_date_frame.grid_rowconfigure(2, weight=0)
-        self.name_and_date_frame.grid_rowconfigure(3, weight=1)
+        self.name_and_date_frame.grid_columnconfigure((0, 3), weight=1)
+        self.name_and_date_frame.grid_columnconfigure((1, 2), weight=0)
+        self.name_and_date_frame.grid_rowconfigure((0, 3), weight=1)
+        self.name_and_date_frame.grid_rowconfigure((1, 2), weight=0)
 
         self.name_entry = ctk.CTkEntry(
             self.name_and_date_frame,
             placeholder_text="Enter name here",
-            font=self.fonts["body"],
+            font=body_font,
             width=200,
         )
         self.name_entry.grid(row=1, column=1, pady=(10, 5), padx=(0, 10), sticky="e")
@@ -124,7 +141,7 @@ class AddOutfieldFrame1(
         )
 
         self.in_game_date_label = ctk.CTkLabel(
-            self.name_and_date_frame, text="In-game date:", font=self.fonts["body"]
+            self.name_and_date_frame, text="In-game date:", font=body_font
         )
         self.in_game_date_label.grid(
             row=2, column=1, padx=(20, 10), pady=(10, 5), sticky="w"
@@ -132,7 +149,7 @@ class AddOutfieldFrame1(
         self.in_game_date_entry = ctk.CTkEntry(
             self.name_and_date_frame,
             placeholder_text="dd/mm/yy",
-            font=self.fonts["body"],
+            font=body_font,
         )
         self.in_game_date_entry.grid(
             row=2, column=2, pady=(10, 5), padx=(10, 20), sticky="ew"
@@ -140,91 +157,72 @@ class AddOutfieldFrame1(
 
         self.base_attr_row = ctk.CTkFrame(self)
         self.base_attr_row.grid(row=3, column=1, pady=(5, 10), sticky="nsew")
-        for i in range(7):
-            self.base_attr_row.grid_columnconfigure(i, weight=1 if i in [0, 6] else 0)
+        self.base_attr_row.grid_columnconfigure((0, 6), weight=1)
+        self.base_attr_row.grid_columnconfigure((1, 2, 3, 4, 5), weight=0)
         self.base_attr_row.grid_rowconfigure(0, weight=1)
 
-        self.position_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Position",
-            font=self.fonts["body"],
-            width=160,
+        self.position_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Position", row=0, column=1
         )
-        self.position_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-
-        self.age_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Age",
-            font=self.fonts["body"],
-            width=160,
+        self.age_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Age", row=0, column=2
         )
-        self.age_entry.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
-
-        self.height_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Height (ft'in\")",
-            font=self.fonts["body"],
-            width=160,
+        self.height_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Height (ft'in\")", row=0, column=3
         )
-        self.height_entry.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
-
-        self.weight_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Weight (lbs)",
-            font=self.fonts["body"],
-            width=160,
+        self.weight_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Weight (lbs)", row=0, column=4
         )
-        self.weight_entry.grid(row=0, column=4, padx=5, pady=5, sticky="ew")
-
-        self.country_entry = ctk.CTkEntry(
-            self.base_attr_row,
-            placeholder_text="Country",
-            font=self.fonts["body"],
-            width=160,
+        self.country_entry = self.create_placeholder_entry(
+            self.base_attr_row, "Country", row=0, column=5
         )
-        self.country_entry.grid(row=0, column=5, padx=5, pady=5, sticky="ew")
 
         self.attributes_grid = ctk.CTkScrollableFrame(self)
         self.attributes_grid.grid(row=4, column=1, pady=(0, 10), sticky="nsew")
 
-        for i in range(6):
-            self.attributes_grid.grid_columnconfigure(i, weight=1 if i in [0, 5] else 0)
-        for i in range(
-            max(len(self.attr_definitions_physical), len(self.attr_definitions_mental))
-        ):
-            self.attributes_grid.grid_rowconfigure(i, weight=1)
-
-        for i, (key, label) in enumerate(self.attr_definitions_physical):
-            self.create_data_row(
-                parent_widget=self.attributes_grid,
-                index=i,
-                stat_key=key,
-                stat_label=label,
-                target_dict=self.attr_vars,
-                label_col=1,
-                entry_col=2,
-            )
+        self.attributes_grid.grid_columnconfigure((0, 5), weight=1)
+        self.attributes_grid.grid_columnconfigure((1, 2, 3, 4), weight=0)
+        row_count = max(
+            len(OUTFIELD_PHYSICAL_ATTR_DEFINITIONS),
+            len(OUTFIELD_MENTAL_ATTR_DEFINITIONS),
+        )
+        self.attributes_grid.grid_rowconfigure(tuple(range(row_count)), weight=1)
 
-        for i, (key, label) in enumerate(self.attr_definitions_mental):
-            self.create_data_row(
-                parent_widget=self.attributes_grid,
-                index=i,
-                stat_key=key,
-                stat_label=label,
-                target_dict=self.attr_vars,
-                label_col=3,
-                entry_col=4,
-            )
+        # Physical attributes fill columns 1-2, mental attributes columns 3-4
+        for definitions, label_col in (
+            (OUTFIELD_PHYSICAL_ATTR_DEFINITIONS, 1),
+            (OUTFIELD_MENTAL_ATTR_DEFINITIONS, 3),
+        ):
+            for i, (key, label) in enumerate(definitions):
+                self.create_data_row(
+                    parent_widget=self.attributes_grid,
+                    index=i,
+                    stat_key=key,
+                    stat_label=label,
+                    target_dict=self.attr_vars,
+                    label_col=label_col,
+                    entry_col=label_col + 1,
+                )
 
         self.next_page_button = ctk.CTkButton(
             self,
             text="Next Page",
             font=self.fonts["button"],
-            command=lambda: self.on_next_page(),
+            command=self.on_next_page,
         )
         self.next_page_button.grid(row=5, column=1, pady=(5, 10), sticky="ew")
         self.style_submit_button(self.next_page_button)
 
+        self._resettable_entries: tuple[ctk.CTkEntry, ...] = (
+            self.name_entry,
+            self.in_game_date_entry,
+            self.position_entry,
+            self.age_entry,
+            self.height_entry,
+            self.weight_entry,
+            self.country_entry,
+        )
+
         self.apply_focus_flourishes(self)
 
     def on_show(self) -> None:
@@ -241,26 +239,7 @@ class AddOutfieldFrame1(
         self.refresh_player_dropdown(only_outfield=True)
         self.player_dropdown.set_value("Or select existing player")
 
-        self.name_entry.delete(0, "end")
-        self.name_entry.configure(placeholder_text="Enter name here")
-
-        self.in_game_date_entry.delete(0, "end")
-        self.in_game_date_entry.configure(placeholder_text="dd/mm/yy")
-
-        self.position_entry.delete(0, "end")
-        self.position_entry.configure(placeholder_text="Position")
-
-        self.age_entry.delete(0, "end")
-        self.age_entry.configure(placeholder_text="Age")
-
-        self.height_entry.delete(0, "end")
-        self.height_entry.configure(placeholder_text="Height (ft'in\")")
-
-        self.weight_entry.delete(0, "end")
-        self.weight_entry.configure(placeholder_text="Weight (lbs)")
-
-        self.country_entry.delete(0, "end")
-        self.country_entry.configure(placeholder_text="Country")
+        self.clear_entries(self._resettable_entries)
 
         # Reset scrollbar to top
         self.attributes_grid._parent_canvas.yview_moveto(0)
@@ -307,18 +286,29 @@ class AddOutfieldFrame1(
         during buffering or transition are caught and reported without crashing the app.
 
         """
+        player_name_dropdown: str | None = self.resolve_selected_player_name(
+            self.player_dropdown_var.get()
+        )
+        player_name: str | None = (
+            player_name_dropdown or self.name_entry.get().strip() or None
+        )
+        if player_name is None:
+            self.show_error(
+                "Validation Error", "Please enter a name or select an existing player."
+            )
+            return
+
         # Convert attributes to int immediately
-        ui_data: dict[str, str | int | None] = {
+        ui_data: PlayerAttributePayload = {
             key: safe_int_conversion(var.get()) for key, var in self.attr_vars.items()
         }
 
-        if not self.validate_attr_range(
-            ui_data, self.attr_definitions_physical + self.attr_definitions_mental
-        ):
+        if not self.validate_attr_range(ui_data, OUTFIELD_PAGE1_ATTR_DEFINITIONS):
             return
+        ui_data["name"] = player_name
 
         # Handle Text fields
-        # usage of "or None" ensures empty strings become None for consistent validation
+        # Placeholder text and empty strings are normalized to None
         invalid_fields: list[str] = [
             "Enter name here",
             "dd/mm/yy",
@@ -329,21 +319,9 @@ class AddOutfieldFrame1(
             "Position",
             "",
         ]
-        player_name_dropdown: str | None = self.resolve_selected_player_name(
-            self.player_dropdown_var.get()
-        )
-        ui_data["name"] = player_name_dropdown or self.name_entry.get().strip() or None
-
-        if ui_data["name"] is None:
-            self.show_error(
-                "Validation Error", "Please enter a name or select an existing player."
-            )
-            return
-
         is_existing_player = player_name_dropdown is not None
 
-        country: str = self.country_entry.get().strip()
-        ui_data["country"] = country if country not in invalid_fields else None
+        ui_data["country"] = self.read_optional_text(self.country_entry, invalid_fields)
 
         in_game_date: str = self.in_game_date_entry.get().strip()
         if not self.validate_in_game_date(in_game_date):
@@ -352,26 +330,19 @@ class AddOutfieldFrame1(
 
         ui_data["height"] = self._get_height(invalid_fields)
 
-        position: str = self.position_entry.get().strip()
-        ui_data["position"] = position if position not in invalid_fields else None
-
-        # Handle Numeric bio fields
-        age_raw: int | None = safe_int_conversion(self.age_entry.get())
-        if age_raw is None:
-            ui_data["age"] = None
+        ui_data["position"] = self.read_optional_text(
+            self.position_entry, invalid_fields
+        )
 
-        elif not self.validate_age(age_raw):
+        age: int | None = safe_int_conversion(self.age_entry.get())
+        if not self.validate_age(age):
             return
-        else:
-            ui_data["age"] = age_raw
-        weight_raw: int | None = safe_int_conversion(self.weight_entry.get())
-        if weight_raw is None:
-            ui_data["weight"] = None
+        ui_data["age"] = age
 
-        elif not self.validate_weight(weight_raw):
+        weight: int | None = safe_int_conversion(self.weight_entry.get())
+        if not self.validate_weight(weight):
             return
-        else:
-            ui_data["weight"] = weight_raw
+        ui_data["weight"] = weight
 
         if not self._validate_required_fields(ui_data, is_existing_player):
             return
@@ -393,15 +364,14 @@ class AddOutfieldFrame1(
         Returns:
             str | None: Normalized height string when valid, otherwise None.
         """
-        height_raw: str = self.height_entry.get().strip()
-        if height_raw and height_raw not in invalid_fields:
-            height: str | None = self.validate_height(height_raw)
-            return None if height is None else height
-        return None
+        height_raw: str | None = self.read_optional_text(
+            self.height_entry, invalid_fields
+        )
+        return None if height_raw is None else self.validate_height(height_raw)
 
     def _validate_required_fields(
-        self, ui_data: dict[str, str | int | None], is_existing_player: bool
-    ) -> bool:  # sourcery skip: remove-redundant-constructor-in-dict-union
+        self, ui_data: PlayerAttributePayload, is_existing_player: bool
+    ) -> bool:
         """Check whether all required fields are present for the save scenario.
 
         Required fields differ between existing-player and new-player flows.
@@ -411,7 +381,7 @@ class AddOutfieldFrame1(
         base-frame helper.
 
         Args:
-            ui_data (dict[str, str | int | None]): Candidate payload assembled
+            ui_data (PlayerAttributePayload): Candidate payload assembled
                 from current form values.
             is_existing_player (bool): True when a player was chosen from the
                 dropdown; False for a newly entered player.
@@ -419,32 +389,15 @@ class AddOutfieldFrame1(
         Returns:
             bool: True when required fields are present; False otherwise.
         """
-        key_to_label: dict[str, str] = (
-            {
-                "name": "Name",
-                "in_game_date": "In-game Date",
-                "position": "Position",
-                "height": "Height",
-                "country": "Country",
-                "age": "Age",
-                "weight": "Weight",
-            }
-            | dict(self.attr_definitions_physical)
-            | dict(self.attr_definitions_mental)
-        )
-        if is_existing_player:
-            required_keys: list[str] = (
-                [k for k, _ in self.attr_definitions_physical]
-                + [k for k, _ in self.attr_definitions_mental]
-                + ["name", "in_game_date"]
-            )
-        else:
-            required_keys = None
         return self.check_missing_fields(
-            ui_data, key_to_label, required_keys=required_keys
+            ui_data,
+            OUTFIELD_PAGE1_KEY_TO_LABEL,
+            required_keys=(
+                OUTFIELD_EXISTING_PLAYER_REQUIRED_KEYS if is_existing_player else None
+            ),
         )
 
-    def _buffer_and_transition(self, ui_data: dict[str, str | int | None]) -> bool:
+    def _buffer_and_transition(self, ui_data: PlayerAttributePayload) -> bool:
         # sourcery skip: extract-method
         """Buffer player data and move on to the next page.
 
@@ -454,9 +407,8 @@ class AddOutfieldFrame1(
         crashing the app, allowing the user to attempt to fix any issues and resubmit.
 
         Args:
-            ui_data (dict[str, str  |  int  |  None]): Fully validated outfield player
-                                                       data ready for buffering and
-                                                       persistence.
+            ui_data (PlayerAttributePayload): Fully validated outfield player
+                data ready for buffering and persistence.
 
         Returns:
             bool: True when buffering and transition succeed;
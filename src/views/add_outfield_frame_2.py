@@ -20,6 +20,27 @@ from src.views.mixins import EntryFocusMixin, OCRDataMixin
 
 logger = logging.getLogger(__name__)
 
+# Technical attribute keys and their display labels, in on-screen order
+OUTFIELD_PAGE2_ATTR_DEFINITIONS: tuple[tuple[str, str], ...] = (
+    ("ball_control", "Ball Control"),
+    ("crossing", "Crossing"),
+    ("curve", "Curve"),
+    ("defensive_awareness", "Def. Awareness"),
+    ("dribbling", "Dribbling"),
+    ("fk_accuracy", "FK Accuracy"),
+    ("finishing", "Finishing"),
+    ("heading_accuracy", "Heading Acc."),
+    ("long_pass", "Long Pass"),
+    ("long_shots", "Long Shots"),
+    ("penalties", "Penalties"),
+    ("short_pass", "Short Pass"),
+    ("shot_power", "Shot Power"),
+    ("slide_tackle", "Slide Tackle"),
+    ("stand_tackle", "Stand Tackle"),
+    ("volleys", "Volleys"),
+)
+OUTFIELD_PAGE2_KEY_TO_LABEL: dict[str, str] = dict(OUTFIELD_PAGE2_ATTR_DEFINITIONS)
+
 
 class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
     """Second-page frame for outfield technical attribute entry.
@@ -37,8 +58,8 @@ class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
         """Build and configure the technical-attributes entry form.
 
         Creates the title, a two-column attributes grid, and a submit button
-        for finalizing outfield player creation. Attribute definitions are
-        stored in a single mapping list and rendered dynamically so labels,
+        for finalizing outfield player creation. Attribute definitions come
+        from a module-level tuple and are rendered dynamically so labels,
         payload keys, and validation targets stay in sync.
 
         Args:
@@ -54,24 +75,6 @@ class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
         logger.info("Initializing AddOutfieldFrame2")
 
         self.attr_vars: dict[str, ctk.StringVar] = {}
-        self.attr_definitions: list[tuple[str, str]] = [
-            ("ball_control", "Ball Control"),
-            ("crossing", "Crossing"),
-            ("curve", "Curve"),
-            ("defensive_awareness", "Def. Awareness"),
-            ("dribbling", "Dribbling"),
-            ("fk_accuracy", "FK Accuracy"),
-            ("finishing", "Finishing"),
-            ("heading_accuracy", "Heading Acc."),
-            ("long_pass", "Long Pass"),
-            ("long_shots", "Long Shots"),
-            ("penalties", "Penalties"),
-            ("short_pass", "Short Pass"),
-            ("shot_power", "Shot Power"),
-            ("slide_tackle", "Slide Tackle"),
-            ("stand_tackle", "Stand Tackle"),
-            ("volleys", "Volleys"),
-        ]
 
         self._setup_ui()
 
@@ -82,13 +85,10 @@ class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
         button so users can complete and submit an outfield player's final
         ratings.
         """
-        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure((0, 2), weight=1)
         self.grid_columnconfigure(1, weight=2)
-        self.grid_columnconfigure(2, weight=1)
         self.grid_rowconfigure(0, weight=1)
-        self.grid_rowconfigure(1, weight=0)
-        self.grid_rowconfigure(2, weight=0)
-        self.grid_rowconfigure(3, weight=0)
+        self.grid_rowconfigure((1, 2, 3), weight=0)
         self.grid_rowconfigure(4, weight=5)
 
         self.title = ctk.CTkLabel(
@@ -99,14 +99,13 @@ class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
         self.attributes_grid = ctk.CTkFrame(self)
         self.attributes_grid.grid(row=2, column=1, pady=(10, 20), sticky="nsew")
 
-        for i in range(6):
-            self.attributes_grid.grid_columnconfigure(i, weight=1 if i in [0, 5] else 0)
+        self.attributes_grid.grid_columnconfigure((0, 5), weight=1)
+        self.attributes_grid.grid_columnconfigure((1, 2, 3, 4), weight=0)
         # Use half the list height so the left and right columns share the same rows
-        half = len(self.attr_definitions) // 2
-        for i in range(half):
-            self.attributes_grid.grid_rowconfigure(i, weight=1)
+        half = len(OUTFIELD_PAGE2_ATTR_DEFINITIONS) // 2
+        self.attributes_grid.grid_rowconfigure(tuple(range(half)), weight=1)
 
-        for i, (key, label) in enumerate(self.attr_definitions):
+        for i, (key, label) in enumerate(OUTFIELD_PAGE2_ATTR_DEFINITIONS):
             row = i % half
             label_col = 1 if i < half else 3
             entry_col = label_col + 1
@@ -124,7 +123,7 @@ class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
             self,
             text="Done",
             font=self.fonts["button"],
-            command=lambda: self._on_done_button_press(),
+            command=self._on_done_button_press,
         )
         self.done_button.grid(row=3, column=1, pady=(0, 20), sticky="ew")
         self.style_submit_button(self.done_button)
@@ -149,11 +148,11 @@ class AddOutfieldFrame2(BaseViewFrame, OCRDataMixin, EntryFocusMixin):
         }
 
         # Validate that all attributes are within the expected range (1-99)
-        if not self.validate_attr_range(ui_data, self.attr_definitions):
+        if not self.validate_attr_range(ui_data, OUTFIELD_PAGE2_ATTR_DEFINITIONS):
             return
 
         # Check for missing fields
-        if not self.check_missing_fields(ui_data, dict(self.attr_definitions)):
+        if not self.check_missing_fields(ui_data, OUTFIELD_PAGE2_KEY_TO_LABEL):
             return
 
         try:
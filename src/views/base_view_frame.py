@@ -23,6 +23,7 @@ Design notes:
 import logging
 import re
 import tkinter as tk
+from collections.abc import Collection, Iterable, Sequence
 from datetime import datetime
 from typing import Any
 
@@ -46,10 +47,17 @@ from src.schemas import (
     PLAYER_WEIGHT_MAX,
     PLAYER_WEIGHT_MIN,
 )
+from src.utils import parse_in_game_date
 from src.views.widgets.custom_alert import CustomAlert
 
 logger = logging.getLogger(__name__)
 
+# Free-text input formats, compiled once at import for the validation helpers
+SEASON_SHORT_PATTERN = re.compile(r"^(\d{2})/(\d{2})$")
+SEASON_LONG_PATTERN = re.compile(r"^(\d{2})\d{2}/(\d{2})\d{2}$")
+HEIGHT_NORMALIZED_PATTERN = re.compile(r'^(\d{1,2})\'(\d{1,2})"$')
+HEIGHT_FT_IN_PATTERN = re.compile(r"^(\d{1,2})ft\s?(\d{1,2})in$")
+
 
 class BaseViewFrame(ctk.CTkFrame):
     """Shared parent frame for navigation and data-entry oriented views.
@@ -264,6 +272,40 @@ class BaseViewFrame(ctk.CTkFrame):
         self.controller.show_frame(self.controller.get_frame_class("MainMenuFrame"))
 
     # --- Popup Managers ---
+    def _show_alert(
+        self,
+        title: str,
+        message: str,
+        alert_type: str,
+        options: Sequence[AlertOption] | None = None,
+        success_timeout: int = 0,
+    ) -> CustomAlert:
+        """Open a themed alert dialog anchored to this frame.
+
+        Shared by the public `show_*` helpers so the parent, theme, and font
+        wiring for `CustomAlert` lives in one place.
+
+        Args:
+            title (str): Alert title text.
+            message (str): Alert body text.
+            alert_type (str): Semantic alert kind (info, error, success, warning).
+            options (Sequence[AlertOption] | None): Optional button definitions.
+            success_timeout (int): Auto-close duration in seconds; 0 disables it.
+
+        Returns:
+            CustomAlert: The constructed alert dialog.
+        """
+        return CustomAlert(
+            parent=self,
+            theme=self.theme,
+            fonts=self.fonts,
+            title=title,
+            message=message,
+            alert_type=alert_type,
+            options=options,
+            success_timeout=success_timeout,
+        )
+
     def show_info(
         self,
         title: str,
@@ -291,16 +333,7 @@ class BaseViewFrame(ctk.CTkFrame):
             str | None: The selected option label, or None when no selection is
             returned by the dialog.
         """
-        alert = CustomAlert(
-            parent=self,
-            theme=self.theme,
-            fonts=self.fonts,
-            title=title,
-            message=message,
-            alert_type="info",
-            options=options,
-        )
-        return alert.get_result()
+        return self._show_alert(title, message, "info", options=options).get_result()
 
     def show_error(self, title: str, message: str) -> None:
         """Display a blocking error alert dialog.
@@ -309,14 +342,7 @@ class BaseViewFrame(ctk.CTkFrame):
             title (str): Alert title text.
             message (str): Alert body text.
         """
-        CustomAlert(
-            parent=self,
-            theme=self.theme,
-            fonts=self.fonts,
-            title=title,
-            message=message,
-            alert_type="error",
-        )
+        self._show_alert(title, message, "error")
 
     def show_success(self, title: str, message: str, timeout: int = 2) -> None:
         """Display a success alert that automatically closes after a timeout.
@@ -326,15 +352,7 @@ class BaseViewFrame(ctk.CTkFrame):
             message (str): Alert body text.
             timeout (int): Auto-close duration in seconds. Defaults to 2.
         """
-        CustomAlert(
-            parent=self,
-            theme=self.theme,
-            fonts=self.fonts,
-            title=title,
-            message=message,
-            alert_type="success",
-            success_timeout=timeout,
-        )
+        self._show_alert(title, message, "success", success_timeout=timeout)
 
     def show_warning(
         self, title: str, message: str, options: list[str] | None = None
@@ -350,16 +368,7 @@ class BaseViewFrame(ctk.CTkFrame):
             str | None: The selected option label, or None when no selection is
             returned by the dialog.
         """
-        alert = CustomAlert(
-            parent=self,
-            theme=self.theme,
-            fonts=self.fonts,
-            title=title,
-            message=message,
-            alert_type="warning",
-            options=options,
-        )
-        return alert.get_result()
+        return self._show_alert(title, message, "warning", options=options).get_result()
 
     def show_discrepancy_alert(
         self, discrepancies: dict[str, dict[str, int | float]]
@@ -428,7 +437,8 @@ class BaseViewFrame(ctk.CTkFrame):
             entry_col (int): Grid column for the entry. Defaults to 2.
             entry_width (int): Entry width in pixels. Defaults to 140.
         """
-        label = ctk.CTkLabel(parent_widget, text=stat_label, font=self.fonts["body"])
+        body_font: ctk.CTkFont = self.fonts["body"]
+        label = ctk.CTkLabel(parent_widget, text=stat_label, font=body_font)
         label.grid(row=index, column=label_col, sticky="w", padx=5, pady=5)
 
         entry_var = ctk.StringVar(value="")
@@ -437,17 +447,83 @@ class BaseViewFrame(ctk.CTkFrame):
             parent_widget,
             textvariable=entry_var,
             width=entry_width,
-            font=self.fonts["body"],
+            font=body_font,
         )
         entry.grid(row=index, column=entry_col, sticky="ew", pady=5, padx=5)
 
+    def create_placeholder_entry(
+        self,
+        parent_widget: ctk.CTkBaseClass,
+        placeholder: str,
+        row: int,
+        column: int,
+        width: int = 160,
+    ) -> ctk.CTkEntry:
+        """Create and grid a free-text entry that shows a placeholder when empty.
+
+        Used for compact rows of bio inputs (age, height, weight, ...) that
+        share the same styling and padding and differ only in placeholder text
+        and grid position.
+
+        Args:
+            parent_widget (ctk.CTkBaseClass): Parent widget for the entry.
+            placeholder (str): Placeholder text shown while the entry is empty.
+            row (int): Grid row for the entry.
+            column (int): Grid column for the entry.
+            width (int): Entry width in pixels. Defaults to 160.
+
+        Returns:
+            ctk.CTkEntry: The created entry widget.
+        """
+        entry = ctk.CTkEntry(
+            parent_widget,
+            placeholder_text=placeholder,
+            font=self.fonts["body"],
+            width=width,
+        )
+        entry.grid(row=row, column=column, padx=5, pady=5, sticky="ew")
+        return entry
+
+    def read_optional_text(
+        self, entry: ctk.CTkEntry, sentinels: Collection[str] = ()
+    ) -> str | None:
+        """Return an entry's stripped text, or None when it holds no real value.
+
+        Empty input and any sentinel value (typically leftover placeholder
+        text) are normalized to None so downstream validation can treat them
+        as missing.
+
+        Args:
+            entry (ctk.CTkEntry): Entry widget to read.
+            sentinels (Collection[str]): Values that should be treated as
+                empty. Defaults to no sentinels.
+
+        Returns:
+            str | None: The stripped text, or None when empty or a sentinel.
+        """
+        text: str = entry.get().strip()
+        return text if text and text not in sentinels else None
+
+    def clear_entries(self, entries: Iterable[ctk.CTkEntry]) -> None:
+        """Empty the given entries so their placeholders show again.
+
+        CTkEntry restores its own placeholder once emptied while unfocused, so
+        entries that are already empty are skipped to avoid a needless redraw.
+
+        Args:
+            entries (Iterable[ctk.CTkEntry]): Entry widgets to clear.
+        """
+        for entry in entries:
+            if entry.get():
+                entry.delete(0, "end")
+
     # --- Validation Helpers ---
     def check_missing_fields(
         self,
         data: dict[str, Any],
         key_to_label: dict[str, str],
-        required_keys: list[str] | None = None,
-        zero_invalid_keys: list[str] | None = None,
+        required_keys: Sequence[str] | None = None,
+        zero_invalid_keys: Sequence[str] | None = None,
     ) -> bool:
         """Validate that required keys are present and non-empty.
 
@@ -457,9 +533,9 @@ class BaseViewFrame(ctk.CTkFrame):
         Args:
             data (dict[str, Any]): Input mapping to validate.
             key_to_label (dict[str, str]): Display labels keyed by data field.
-            required_keys (list[str] | None): Specific keys to enforce. Defaults
-                to all keys from `key_to_label`.
-            zero_invalid_keys (list[str] | None): Keys for which zero-like values
+            required_keys (Sequence[str] | None): Specific keys to enforce.
+                Defaults to all keys from `key_to_label`.
+            zero_invalid_keys (Sequence[str] | None): Keys for which zero-like values
                 should be treated as invalid.
 
         Returns:
@@ -482,21 +558,20 @@ class BaseViewFrame(ctk.CTkFrame):
             except ValueError:
                 return False
 
-        if required_keys is None:
-            required_keys: list[str] = list(key_to_label.keys())
-        if zero_invalid_keys is None:
-            zero_invalid_keys: list[str] = []
+        zero_invalid: frozenset[str] = frozenset(zero_invalid_keys or ())
 
-        if missing_fields := [
-            key
-            for key in required_keys
+        # Single pass with one lookup per key; absent keys read as None
+        missing_fields: list[str] = []
+        for key in key_to_label if required_keys is None else required_keys:
+            value = data.get(key)
             if (
-                key not in data
-                or data.get(key) is None
-                or not str(data.get(key)).strip()
-                or (key in zero_invalid_keys and is_zero_value(data.get(key)))
-            )
-        ]:
+                value is None
+                or not str(value).strip()
+                or (key in zero_invalid and is_zero_value(value))
+            ):
+                missing_fields.append(key)
+
+        if missing_fields:
             logger.debug(f"Missing required fields: {missing_fields}")
             missing_fields_text: str = ", ".join(
                 key_to_label.get(key, key) for key in missing_fields
@@ -515,7 +590,7 @@ class BaseViewFrame(ctk.CTkFrame):
     def validate_attr_range(
         self,
         data: dict[str, Any],
-        data_definitions: list[tuple[str, str]],
+        data_definitions: Sequence[tuple[str, str]],
         min_val: int = ATTRIBUTE_RATING_MIN,
         max_val: int = ATTRIBUTE_RATING_MAX,
     ) -> bool:  # sourcery skip: extract-method
@@ -527,7 +602,7 @@ class BaseViewFrame(ctk.CTkFrame):
 
         Args:
             data (dict[str, Any]): Attribute mapping to validate.
-            data_definitions (list[tuple[str, str]]): Key/label pairs used for
+            data_definitions (Sequence[tuple[str, str]]): Key/label pairs used for
                 user-facing error messages.
             min_val (int): Inclusive minimum accepted value. Defaults to 1.
             max_val (int): Inclusive maximum accepted value. Defaults to 99.
@@ -594,10 +669,10 @@ class BaseViewFrame(ctk.CTkFrame):
             str | None: Normalized `YY/YY` season string, or None when invalid.
         """
         season: str = season.strip()
-        if re.match(r"^(\d{2})/(\d{2})$", season):
+        if SEASON_SHORT_PATTERN.match(season):
             return season
 
-        if long_match := re.match(r"^(\d{2})\d{2}/(\d{2})\d{2}$", season):
+        if long_match := SEASON_LONG_PATTERN.match(season):
             start_suffix, end_suffix = long_match.groups()
             return f"{start_suffix}/{end_suffix}"
 
@@ -668,13 +743,13 @@ class BaseViewFrame(ctk.CTkFrame):
             str | None: Normalized height string (`X'Y"`) or None when invalid.
         """
         height = height.strip()
-        if normalized_match := re.match(r'^(\d{1,2})\'(\d{1,2})"$', height):
+        if normalized_match := HEIGHT_NORMALIZED_PATTERN.match(height):
             feet = int(normalized_match[1])
             inches = int(normalized_match[2])
             if 1 <= feet <= 8 and 0 <= inches < 12:
                 return f"{feet}'{inches}\""
 
-        if match := re.match(r"^(\d{1,2})ft\s?(\d{1,2})in$", height):
+        if match := HEIGHT_FT_IN_PATTERN.match(height):
             feet = int(match[1])
             inches = int(match[2])
             if 1 <= feet <= 8 and 0 <= inches < 12:
@@ -930,13 +1005,7 @@ class BaseViewFrame(ctk.CTkFrame):
             otherwise False.
         """
         date_str: str = date_str.strip()
-        parsed: datetime | None = None
-        for fmt in ("%d/%m/%y", "%d/%m/%Y"):
-            try:
-                parsed: datetime = datetime.strptime(date_str, fmt)
-                break
-            except ValueError:
-                continue
+        parsed: datetime | None = parse_in_game_date(date_str)
 
         if parsed is None:
             logger.warning(f"Date validation failed for input: {date_str}")
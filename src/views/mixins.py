@@ -157,6 +157,20 @@ class OCRDataMixin:
             return {"": stats_vars}
         return {}
 
+    @staticmethod
+    def _set_entry_text(var: ctk.StringVar, value: OCRScalar) -> None:
+        """Write an OCR value into a bound variable as entry text.
+
+        Always sets the variable, even when the text is unchanged, so write
+        traces fire on every population (e.g. live rating recalculation after
+        a re-scan of the same screen). None is rendered as an empty string.
+
+        Args:
+            var (ctk.StringVar): Variable bound to the target entry.
+            value (OCRScalar): OCR value to display.
+        """
+        var.set("" if value is None else str(value))
+
     def populate_stats(self, stats: OCRStatsPayload) -> None:
         """Populate bound StringVar fields from OCR statistics payloads.
 
@@ -173,28 +187,59 @@ class OCRDataMixin:
         if not stats:
             raise UIPopulationError("No stats data provided for population")
 
-        def _to_entry_text(value: OCRScalar) -> str:
-            return "" if value is None else str(value)
-
         mapping: dict[str, dict[str, ctk.StringVar]] = self.get_ocr_mapping()
 
         for prefix, var_dict in mapping.items():
-            for key, var in var_dict.items():
-                # Case A: Nested dict (e.g. stats["home"]["possession"])
-                nested_value = stats.get(prefix) if prefix else None
-                if isinstance(nested_value, dict):
-                    nested_stats = nested_value
-                    if key in nested_stats:
-                        var.set(_to_entry_text(nested_stats[key]))
-                    else:
-                        logger.warning(f"Key '{key}' not found in stats['{prefix}']")
-
-                # Case B: Flat dict (e.g. stats["possession"])
-                elif not prefix and key in stats:
-                    flat_value = stats[key]
-                    if isinstance(flat_value, dict):
-                        continue
-                    var.set(_to_entry_text(flat_value))
+            if prefix:
+                self._populate_nested(prefix, var_dict, stats)
+            else:
+                self._populate_flat(var_dict, stats)
+
+    def _populate_nested(
+        self,
+        prefix: str,
+        var_dict: dict[str, ctk.StringVar],
+        stats: OCRStatsPayload,
+    ) -> None:
+        """Fill variables from a nested payload section (e.g. stats["home"]).
+
+        Skips the section when it is missing or not a dictionary and logs a
+        warning for each bound key absent from it.
+
+        Args:
+            prefix (str): Top-level payload key holding the nested section.
+            var_dict (dict[str, ctk.StringVar]): Variables keyed by stat name.
+            stats (OCRStatsPayload): OCR-derived mapping of stat keys to values.
+        """
+        nested_stats = stats.get(prefix)
+        if not isinstance(nested_stats, dict):
+            return
+        for key, var in var_dict.items():
+            if key in nested_stats:
+                self._set_entry_text(var, nested_stats[key])
+            else:
+                logger.warning(f"Key '{key}' not found in stats['{prefix}']")
+
+    def _populate_flat(
+        self,
+        var_dict: dict[str, ctk.StringVar],
+        stats: OCRStatsPayload,
+    ) -> None:
+        """Fill variables from top-level payload values (e.g. stats["possession"]).
+
+        Keys missing from the payload and values that are nested dictionaries
+        are left untouched.
+
+        Args:
+            var_dict (dict[str, ctk.StringVar]): Variables keyed by stat name.
+            stats (OCRStatsPayload): OCR-derived mapping of stat keys to values.
+        """
+        for key, var in var_dict.items():
+            if key not in stats:
+                continue
+            flat_value = stats[key]
+            if not isinstance(flat_value, dict):
+                self._set_entry_text(var, flat_value)
 
 
 class PerformanceSidebarMixin:
@@ -247,6 +247,75 @@ def test_refresh_players_is_no_op_without_career(tmp_path: Path) -> None:
     assert dm.players == []
 
 
+def test_refresh_players_if_changed_skips_reload_for_unchanged_file(
+    loaded_data_manager: DataManager,
+) -> None:
+    """refresh_players_if_changed leaves the cache alone when disk is unchanged."""
+    loaded_data_manager.add_or_update_player(
+        player_ui_data=_gk_player_data("David Raya"),
+        position="GK",
+        in_game_date="01/08/24",
+        is_gk=True,
+    )
+    loaded_data_manager.refresh_players_if_changed()
+
+    loaded_data_manager.players = []
+    loaded_data_manager.refresh_players_if_changed()
+
+    assert loaded_data_manager.players == []
+
+
+def test_refresh_players_if_changed_reloads_after_disk_write(
+    loaded_data_manager: DataManager,
+) -> None:
+    """refresh_players_if_changed picks up players saved since the last sync."""
+    loaded_data_manager.refresh_players_if_changed()
+    loaded_data_manager.add_or_update_player(
+        player_ui_data=_gk_player_data("David Raya"),
+        position="GK",
+        in_game_date="01/08/24",
+        is_gk=True,
+    )
+
+    loaded_data_manager.players = []
+    loaded_data_manager.refresh_players_if_changed()
+
+    assert len(loaded_data_manager.players) == 1
+
+
+def test_refresh_players_if_changed_drops_unsaved_edit_after_failed_save(
+    loaded_data_manager: DataManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed player save does not leave the unsaved player in the cache."""
+    loaded_data_manager.add_or_update_player(
+        player_ui_data=_gk_player_data("Saved Keeper"),
+        position="GK",
+        in_game_date="01/08/24",
+        is_gk=True,
+    )
+    loaded_data_manager.refresh_players_if_changed()
+
+    def failing_save(*_args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(
+        loaded_data_manager._json_service,
+        "save_json_atomic_or_raise",
+        failing_save,
+    )
+    with pytest.raises(OSError):
+        loaded_data_manager.add_or_update_player(
+            player_ui_data=_gk_player_data("Phantom Keeper"),
+            position="GK",
+            in_game_date="01/08/24",
+            is_gk=True,
+        )
+    loaded_data_manager.refresh_players_if_changed()
+
+    assert [p.name for p in loaded_data_manager.players] == ["Saved Keeper"]
+
+
 def test_refresh_matches_is_no_op_without_career(tmp_path: Path) -> None:
     """refresh_matches does not raise when no career is loaded."""
     dm = DataManager(project_root=tmp_path)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 
 from src.utils import (
     capitalize_competition_name,
     derive_season,
     normalize_team_name,
+    parse_in_game_date,
     safe_float_conversion,
     safe_int_conversion,
     safe_normalize_name,
@@ -82,6 +85,34 @@ def test_derive_season(date_str: str, expected_season: str) -> None:
     assert derive_season(date_str) == expected_season
 
 
+# ---------------------------------------------------------------------------
+# parse_in_game_date
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("01/07/24", datetime(2024, 7, 1)),
+        ("1/7/24", datetime(2024, 7, 1)),
+        (" 15/01/2025 ", datetime(2025, 1, 15)),
+        ("29/02/24", datetime(2024, 2, 29)),
+        ("01/07/68", datetime(2068, 7, 1)),
+        ("01/07/69", datetime(1969, 7, 1)),
+        ("29/02/23", None),
+        ("32/01/24", None),
+        ("01/13/24", None),
+        ("01/07/124", None),
+        ("01-07-24", None),
+        ("1/\u0663/24", None),
+        ("", None),
+    ],
+)
+def test_parse_in_game_date(date_str: str, expected: datetime | None) -> None:
+    """parse_in_game_date matches strptime for dd/mm/yy and dd/mm/yyyy input."""
+    assert parse_in_game_date(date_str) == expected
+
+
 # ---------------------------------------------------------------------------
 # safe_normalize_name
 # ---------------------------------------------------------------------------